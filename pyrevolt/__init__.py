@@ -1,5 +1,5 @@
 from .client import Method, Request, HTTPClient
-from .gateway import GatewayKeepAlive, Gateway, GatewayEvent
+from .gateway import Gateway, GatewayEvent
 from .events import *
 from .session import Session
 from .bot import Bot
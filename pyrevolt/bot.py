@@ -2,6 +2,10 @@ from __future__ import annotations
 import asyncio
 import json
 from typing import Any
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 from .structs.member import Member
 from .exceptions import InvalidSession
 from .gateway import GatewayEvent
@@ -89,7 +93,10 @@ class Bot:
             async with self:
                 await self.Start(**kwargs)
         try:
-            asyncio.run(runner())
+            if uvloop is not None:
+                uvloop.run(runner())
+            else:
+                asyncio.run(runner())
         except KeyboardInterrupt:
             return
 
@@ -1,8 +1,10 @@
+from __future__ import annotations
 from enum import Enum
-import json
-from typing import Any
-from aiohttp import ClientSession
+from typing import TYPE_CHECKING, Any
 from .exceptions import ClosedSocketException
+from .serialization import dumps, loads
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
 
 class Method(Enum):
     GET = "GET"
@@ -17,9 +19,9 @@ class Request:
     def __init__(self, method: Method, url: str, **kwargs) -> None:
         self.method: Method = method
         self.url: str = f"{self.API_BASE_URL}{url}"
-        self.data: dict[str, Any] = kwargs.get("data", dict())
-        self.headers: dict[str, str] = kwargs.get("headers", dict())
-        self.params: dict[str, Any] = kwargs.get("params", dict())
+        self.data: dict[str, Any] = kwargs.get("data", {})
+        self.headers: dict[str, str] = kwargs.get("headers", {})
+        self.params: dict[str, Any] = kwargs.get("params", {})
         if kwargs.get("auth") is not None:
             self.AddAuthentication(kwargs.get("auth"))
 
@@ -31,8 +33,15 @@ class Request:
 
 class HTTPClient:
     def __init__(self) -> None:
+        from aiohttp import ClientSession
         self.client: ClientSession = ClientSession()
 
+    async def __aenter__(self) -> HTTPClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.Close()
+
     async def Close(self) -> None:
         await self.client.close()
 
@@ -41,11 +50,11 @@ class HTTPClient:
             async with self.client.request(
                 method = request.method.value,
                 url = request.url,
-                data = json.dumps(request.data),
+                data = dumps(request.data) if request.method is not Method.GET else None,
                 headers = request.headers,
                 params = request.params
             ) as result:
                 # TODO: Add status code check
-                return await result.json()
+                return await result.json(loads=loads)
         else:
             raise ClosedSocketException()
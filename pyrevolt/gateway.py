@@ -1,11 +1,12 @@
 from __future__ import annotations
 from enum import Enum
 from .events import *
-from threading import Thread, Event
 import asyncio
 from .client import HTTPClient, Request, Method
-from websockets import client
-import json
+from websockets.asyncio import client
+from websockets.exceptions import ConnectionClosed
+from websockets.protocol import State
+from .serialization import dumps, loads
 from .exceptions import ClosedSocketException
 
 class GatewayEvent(Enum):
@@ -41,68 +42,120 @@ class GatewayEvent(Enum):
     UserUpdate = UserUpdate()
     UserRelationship = UserRelationship()
 
-class GatewayKeepAlive(Thread):
-    def __init__(self, *args, gateway: Gateway, interval: float, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        self.gateway: Gateway = gateway
-        self.interval: float = interval
-        self.daemon: bool = True
-        self.stopEvent: Event = Event()
-
-    def run(self) -> None:
-        while not self.stopEvent.wait(self.interval):
-            data: dict = self.GetPayload()
-            coro = self.gateway.Send(data)
-            func = asyncio.run_coroutine_threadsafe(coro, self.gateway.loop)
-            func.result(10)
-
-    def GetPayload(self) -> dict[str, str|int]:
-        return {
-            "type": GatewayEvent.Ping.value.VALUE,
-            "data": 0
-        }
+    @staticmethod
+    def FromValue(value: str) -> object|None:
+        return _EVENTS_BY_VALUE.get(value)
+
+_EVENTS_BY_VALUE: dict[str, object] = {event.value.VALUE: event.value for event in GatewayEvent}
+_EVENT_VALUES: dict[object, str] = {event.value: event.value.VALUE for event in GatewayEvent}
+_EV_PING: str = GatewayEvent.Ping.value.VALUE
+_EV_AUTHENTICATE: str = GatewayEvent.Authenticate.value.VALUE
+_AUTHENTICATE_FRAME: str = '{"type":"' + _EV_AUTHENTICATE + '","token":%s}'
 
 class Gateway:
-    def __init__(self) -> None:
-        self.client: HTTPClient = HTTPClient()
-        self.loop = asyncio.get_event_loop()
-        self.keepAlive: GatewayKeepAlive = GatewayKeepAlive(gateway=self, interval=20)
-        self.websocket: client.WebSocketClientProtocol | None = client.WebSocketClientProtocol()
+    def __init__(self, **kwargs) -> None:
+        self.ownsClient: bool = kwargs.get("client") is None
+        self.client: HTTPClient = HTTPClient() if self.ownsClient else kwargs["client"]
+        self.keepAliveInterval: float = 20
+        self.keepAlive: asyncio.Task | None = None
+        self.receiveTask: asyncio.Task | None = None
+        self.receiveQueueSize: int = 16
+        self.receiveQueue: asyncio.Queue[dict | ValueError | None] = asyncio.Queue(self.receiveQueueSize)
+        self.pingFrame: str = dumps({
+            "type": _EV_PING,
+            "data": 0
+        })
+        self.websocket: client.ClientConnection | None = None
+        self.websocketURL: str | None = None
 
     async def Close(self) -> None:
-        await self.client.Close()
-        if self.websocket.open:
+        if self.ownsClient:
+            await self.client.Close()
+        self._StopTasks()
+        if self.open:
             await self.websocket.close()
-            self.keepAlive.stopEvent.set()
+        self.websocket = None
+
+    def _StopTasks(self) -> None:
+        if self.keepAlive is not None:
+            self.keepAlive.cancel()
+            self.keepAlive = None
+        if self.receiveTask is not None:
+            self.receiveTask.cancel()
+            self.receiveTask = None
+
+    @property
+    def open(self) -> bool:
+        return self.websocket is not None and self.websocket.state is State.OPEN
 
     async def GetWebsocketURL(self) -> str:
         result: dict = await self.client.Request(Request(Method.GET, "/"))
         return result["ws"]
 
     async def Connect(self) -> None:
-        if not self.websocket.open:
-            self.websocket = await client.connect(await self.GetWebsocketURL())
-            self.keepAlive.stopEvent.clear()
-            self.keepAlive.start()
+        if not self.open:
+            if self.websocketURL is None:
+                self.websocketURL = await self.GetWebsocketURL()
+            self._StopTasks()
+            self.websocket = await client.connect(self.websocketURL, max_size=2**24)
+            self.receiveQueue = asyncio.Queue(self.receiveQueueSize)
+            self.receiveTask = asyncio.create_task(self._ReceiveLoop())
+            self.keepAlive = asyncio.create_task(self._KeepAlive())
+
+    async def _ReceiveLoop(self) -> None:
+        try:
+            while True:
+                try:
+                    message: bytes = await self.websocket.recv(decode=False)
+                except ConnectionClosed:
+                    break
+                try:
+                    data: dict | ValueError = loads(message)
+                except ValueError as error:
+                    data = error
+                await self.receiveQueue.put(data)
+        finally:
+            # If the queue is full, Receive raises once it is drained as the task is done
+            if not self.receiveQueue.full():
+                self.receiveQueue.put_nowait(None)
+
+    async def _KeepAlive(self) -> None:
+        while True:
+            await asyncio.sleep(self.keepAliveInterval)
+            try:
+                await self.SendRaw(self.pingFrame)
+            except (ConnectionClosed, ClosedSocketException):
+                return
 
     async def Send(self, data: dict) -> None:
-        for event in GatewayEvent:
-            if data["type"] == event.value:
-                data["type"] = event.value.VALUE
-                break
-        if self.websocket.open:
-            await self.websocket.send(json.dumps(data))
+        data["type"] = _EVENT_VALUES.get(data["type"], data["type"])
+        await self.SendRaw(dumps(data))
+
+    async def SendRaw(self, frame: str|bytes) -> None:
+        if self.open:
+            await self.websocket.send(frame)
         else:
             raise ClosedSocketException()
 
     async def Receive(self) -> dict:
-        if self.websocket.open:
-            data: str = json.loads(await self.websocket.recv())
-            return data
+        if self.receiveQueue.empty() and (self.receiveTask is None or self.receiveTask.done()):
+            self._RaiseClosed()
+        data: dict | ValueError | None = await self.receiveQueue.get()
+        if data is None:
+            if self.receiveTask is not None:
+                await asyncio.wait((self.receiveTask,))
+            self._RaiseClosed()
+        if isinstance(data, ValueError):
+            raise data
+        return data
+
+    def _RaiseClosed(self) -> None:
+        # Surface whatever stopped the reader; only a clean close is a ClosedSocketException
+        if self.receiveTask is not None and not self.receiveTask.cancelled():
+            error: BaseException | None = self.receiveTask.exception()
+            if error is not None:
+                raise error
         raise ClosedSocketException()
 
     async def Authenticate(self, token: str) -> None:
-        await self.Send({
-            "type": GatewayEvent.Authenticate.value.VALUE,
-            "token": token
-        })
\ No newline at end of file
+        await self.SendRaw(_AUTHENTICATE_FRAME % dumps(token))
\ No newline at end of file
@@ -0,0 +1,13 @@
+from typing import Any
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(data: Any) -> str:
+        return orjson.dumps(data).decode()
+except ImportError:
+    import json
+
+    loads = json.loads
+    dumps = json.dumps
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from .exceptions import WebsocketError, InternalWebsocketError, InvalidSession, OnboardingNotFinished, AlreadyAuthenticated
 from .client import HTTPClient, Method, Request
@@ -9,11 +10,13 @@ from .structs.member import Member
 
 class Session:
     def __init__(self) -> None:
-        self.gateway: Gateway = Gateway()
         self.client: HTTPClient = HTTPClient()
+        self.gateway: Gateway = Gateway(client=self.client)
         self.token: str|None = None
         self.users: dict[str, User] = {}
         self.channels: dict[str, Channel] = {}
+        self.pendingUsers: dict[str, asyncio.Task] = {}
+        self.pendingChannels: dict[str, asyncio.Task] = {}
         self.servers: dict[str, Server] = {}
         self.members: dict[str, Member] = {}
         self.messages: dict[str, Message] = {}
@@ -39,10 +42,9 @@ class Session:
         return await self.client.Request(request)
 
     async def ProcessGateway(self, data: dict) -> dict:
-        for event in GatewayEvent:
-            if data["type"] == event.value.VALUE:
-                data["type"] = event.value
-                break
+        event = GatewayEvent.FromValue(data["type"])
+        if event is not None:
+            data["type"] = event
 
         args: list = []
         kwargs: dict = {}
@@ -69,10 +71,10 @@ class Session:
             case GatewayEvent.Ready.value:
                 await GatewayEvent.ReadySimplified.value.dispatch()
                 for index, user in enumerate(data["users"]):
-                    user: User = await User.FromJSON(json.dumps(user), self)
+                    user: User = await User._FromDict(user, self)
                     data["users"][index] = user
                 for index, channel in enumerate(data["channels"]):
-                    channel: Channel = await Channel.FromJSON(json.dumps(channel), self)
+                    channel: Channel = await Channel._FromDict(channel, self)
                     data["channels"][index] = channel
                 for index, server in enumerate(data["servers"]):
                     server: Server = await Server.FromJSON(json.dumps(server), self)
@@ -105,7 +107,7 @@ class Session:
                 self.messages.pop(data["id"])
                 args.append(message)
             case GatewayEvent.ChannelCreate.value:
-                channel: Channel = await Channel.FromJSON(json.dumps(data), self)
+                channel: Channel = await Channel._FromDict(data, self)
                 self.channels[channel.channelID] = channel
                 args.append(channel)
             case GatewayEvent.ChannelUpdate.value:
@@ -205,7 +207,7 @@ class Session:
     async def GetUser(self, userID: str) -> User:
         if self.users.get(userID) is None:
             data: dict = await self.Request(Method.GET, f"/users/{userID}")
-            user: User = await User.FromJSON(json.dumps(data), self)
+            user: User = await User._FromDict(data, self)
             return user
         else:
             return self.users[userID]
@@ -213,7 +215,7 @@ class Session:
     async def GetChannel(self, channelID: str) -> Channel:
         if self.channels.get(channelID) is None:
             data: dict = await self.Request(Method.GET, f"/channels/{channelID}")
-            channel: Channel = await channel.FromJSON(json.dumps(data), self)
+            channel: Channel = await Channel._FromDict(data, self)
             return channel
         else:
             return self.channels[channelID]
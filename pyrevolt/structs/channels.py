@@ -1,8 +1,11 @@
 from __future__ import annotations
 from enum import Enum
+from types import MemberDescriptorType
+import asyncio
 import json
 from ..exceptions import InvalidMessageException
 from ..client import Method
+from ..serialization import loads
 from .user import User
 from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
@@ -17,6 +20,8 @@ class ChannelType(Enum):
     VoiceChannel = "VoiceChannel"
 
 class Channel:
+    __slots__ = ("channelID", "type", "session")
+
     def __init__(self, channelID: str, type: ChannelType, **kwargs) -> None:
         self.channelID: str = channelID
         self.type: ChannelType = type
@@ -24,80 +29,55 @@ class Channel:
 
     async def update(self, updateData: dict, clear: list[str] = []) -> None:
         for key, value in updateData.items():
-            setattr(self, key, value)
+            key = _CHANNEL_ATTRIBUTES.get(key, key)
+            if isinstance(getattr(type(self), key, None), MemberDescriptorType):
+                setattr(self, key, value)
         for key in clear:
-            setattr(self, key, None)
+            key = key[:1].lower() + key[1:]
+            if isinstance(getattr(type(self), key, None), MemberDescriptorType):
+                setattr(self, key, None)
 
     @staticmethod
     async def FromJSON(jsonData: str|bytes, session: Session) -> Channel:
-        data: dict = json.loads(jsonData)
-        kwargs: dict = {}
+        return await Channel._FromDict(loads(jsonData), session)
+
+    @staticmethod
+    async def _FromDict(data: dict, session: Session) -> Channel:
+        channelClass: type[Channel] = _CHANNEL_TYPES[data["channel_type"]]
+        kwargs: dict = {kwarg: value for key, kwarg in _CHANNEL_KWARGS[data["channel_type"]] if (value := data.get(key)) is not None}
         kwargs["session"] = session
-        channel: Channel = None
-        match data["channel_type"]:
-            case ChannelType.SavedMessages.value:
-                user: User|None = session.users.get(data["user"])
-                if user is None:
-                    user = await User.FromID(data["user"], session.token)
-                channel = SavedMessages(data["_id"], user)
-            case ChannelType.DirectMessage.value:
-                if data.get("last_message_id") is not None:
-                    kwargs["lastMessageID"] = data["last_message_id"]
-                recipients: list[User] = []
-                for userID in data["recipients"]:
-                    user: User|None = session.users.get(userID)
-                    if user is None:
-                        user = await User.FromID(userID, session.token)
-                    recipients.append(user)
-                channel = DirectMessage(data["_id"], data["active"], recipients, **kwargs)
-            case ChannelType.Group.value:
-                if data.get("description") is not None:
-                    kwargs["description"] = data["description"]
-                if data.get("last_message_id") is not None:
-                    kwargs["lastMessageID"] = data["last_message_id"]
-                if data.get("permissions") is not None:
-                    kwargs["permissions"] = data["permissions"]
-                if data.get("nsfw") is not None:
-                    kwargs["nsfw"] = data["nsfw"]
-                recipients: list[User] = []
-                owner: User = None
-                for userID in data["recipients"]:
-                    user: User|None = session.users.get(userID)
-                    if user is None:
-                        user = await User.FromID(userID, session.token)
-                    if user.userID == data["owner"]:
-                        owner = user
-                    recipients.append(user)
-                channel = Group(data["_id"], data["name"], recipients, owner, **kwargs)
-            case ChannelType.TextChannel.value:
-                if data.get("description") is not None:
-                    kwargs["description"] = data["description"]
-                if data.get("default_permissions") is not None:
-                    kwargs["defaultPermissions"] = data["default_permissions"]
-                if data.get("nsfw") is not None:
-                    kwargs["nsfw"] = data["nsfw"]
-                if data.get("last_message_id") is not None:
-                    kwargs["lastMessageID"] = data["last_message_id"]
-                channel = TextChannel(data["_id"], data["server"], data["name"], **kwargs)
-            case ChannelType.VoiceChannel.value:
-                if data.get("description") is not None:
-                    kwargs["description"] = data["description"]
-                if data.get("default_permissions") is not None:
-                    kwargs["defaultPermissions"] = data["defaultPermissions"]
-                if data.get("nsfw") is not None:
-                    kwargs["nsfw"] = data["nsfw"]
-                channel = VoiceChannel(data["_id"], data["server"], data["name"], **kwargs)
+        channel: Channel = channelClass(data["_id"], *await channelClass._ArgsFromDict(data, session), **kwargs)
         session.channels[channel.channelID] = channel
         return channel
 
     @staticmethod
-    async def FromID(channelID: str, session: Session) -> Channel:
+    async def _FetchRecipients(userIDs: list[str], session: Session) -> list[User]:
+        recipients: list[User|None] = [session.users.get(userID) for userID in userIDs]
+        missing: list[int] = [index for index, user in enumerate(recipients) if user is None]
+        if missing:
+            fetched: list[User|None] = await asyncio.gather(*(User.FromID(userIDs[index], session) for index in missing))
+            for index, user in zip(missing, fetched):
+                recipients[index] = user
+            return [user for user in recipients if user is not None]
+        return recipients
+
+    @staticmethod
+    async def FromID(channelID: str, session: Session) -> Channel|None:
         if session.channels.get(channelID) is not None:
             return session.channels[channelID]
+        request: asyncio.Task | None = session.pendingChannels.get(channelID)
+        if request is None:
+            request = asyncio.create_task(Channel._Fetch(channelID, session))
+            session.pendingChannels[channelID] = request
+            request.add_done_callback(lambda _: session.pendingChannels.pop(channelID, None))
+        return await asyncio.shield(request)
+
+    @staticmethod
+    async def _Fetch(channelID: str, session: Session) -> Channel|None:
         result: dict = await session.Request(Method.GET, f"/channels/{channelID}")
         if result.get("type") is not None:
             return
-        return await Channel.FromJSON(json.dumps(result), session)
+        return await Channel._FromDict(result, session)
 
     @staticmethod
     async def AttemptParse(content: str, session: Session) -> Channel|bool:
@@ -132,6 +112,8 @@ class Channel:
         self.session.channels.pop(self.channelID)
 
 class SavedMessages(Channel):
+    __slots__ = ("user",)
+
     def __init__(self, channelID: str, user: User, **kwargs) -> None:
         self.user: User = user
         super().__init__(channelID, ChannelType.SavedMessages, **kwargs)
@@ -142,7 +124,16 @@ class SavedMessages(Channel):
     def copy(self) -> SavedMessages:
         return SavedMessages(self.channelID, self.user, session=self.session)
 
+    @staticmethod
+    async def _ArgsFromDict(data: dict, session: Session) -> tuple:
+        user: User|None = session.users.get(data["user"])
+        if user is None:
+            user = await User.FromID(data["user"], session)
+        return (user,)
+
 class DirectMessage(Channel):
+    __slots__ = ("active", "recipients", "lastMessageID")
+
     def __init__(self, channelID: str, active: bool, recipients: list[User], **kwargs) -> None:
         self.active: bool = active
         self.recipients: list[User] = recipients
@@ -155,11 +146,17 @@ class DirectMessage(Channel):
     def copy(self) -> DirectMessage:
         return DirectMessage(self.channelID, self.active, self.recipients, session=self.session)
 
+    @staticmethod
+    async def _ArgsFromDict(data: dict, session: Session) -> tuple:
+        return (data["active"], await Channel._FetchRecipients(data["recipients"], session))
+
 class Group(Channel):
-    def __init__(self, channelID: str, name: str, recipients: list[User], owner: User, **kwargs) -> None:
+    __slots__ = ("name", "recipients", "owner", "description", "lastMessageID", "permissions", "nsfw")
+
+    def __init__(self, channelID: str, name: str, recipients: list[User], owner: User|None, **kwargs) -> None:
         self.name: str = name
         self.recipients: list[User] = recipients
-        self.owner: User = owner
+        self.owner: User|None = owner
         self.description: str|None = kwargs.get("description")
         self.lastMessageID: str|None = kwargs.get("lastMessageID")
         # TODO: Icon
@@ -176,7 +173,19 @@ class Group(Channel):
     def copy(self) -> Group:
         return Group(self.channelID, self.name, self.recipients, self.owner, session=self.session)
 
+    @staticmethod
+    async def _ArgsFromDict(data: dict, session: Session) -> tuple:
+        recipients: list[User] = await Channel._FetchRecipients(data["recipients"], session)
+        owner: User|None = None
+        for user in recipients:
+            if user.userID == data["owner"]:
+                owner = user
+                break
+        return (data["name"], recipients, owner)
+
 class ServerChannel(Channel):
+    __slots__ = ("server", "name", "description", "defaultPermissions", "nsfw")
+
     def __init__(self, channelID: str, type: ChannelType, server: Server, name: str, **kwargs) -> None:
         self.server: Server = server
         self.name: str = name
@@ -190,7 +199,13 @@ class ServerChannel(Channel):
     def __str__(self) -> str:
         return self.name
 
+    @staticmethod
+    async def _ArgsFromDict(data: dict, session: Session) -> tuple:
+        return (data["server"], data["name"])
+
 class TextChannel(ServerChannel):
+    __slots__ = ("lastMessageID",)
+
     def __init__(self, channelID: str, server: Server, name: str, **kwargs) -> None:
         self.lastMessageID: str|None = kwargs.get("lastMessageID")
         super().__init__(channelID, ChannelType.TextChannel, server, name, **kwargs)
@@ -202,6 +217,8 @@ class TextChannel(ServerChannel):
         return TextChannel(self.channelID, self.server, self.name, session=self.session)
 
 class VoiceChannel(ServerChannel):
+    __slots__ = ()
+
     def __init__(self, channelID: str, server: Server, name: str, **kwargs) -> None:
         super().__init__(channelID, ChannelType.VoiceChannel, server, name, **kwargs)
 
@@ -212,6 +229,40 @@ class VoiceChannel(ServerChannel):
         return f"<pyrevolt.VoiceChannel id={self.channelID} server={self.server.serverID} name={self.name}>"
 
 
+_CHANNEL_TYPES: dict[str, type[Channel]] = {
+    ChannelType.SavedMessages.value: SavedMessages,
+    ChannelType.DirectMessage.value: DirectMessage,
+    ChannelType.Group.value: Group,
+    ChannelType.TextChannel.value: TextChannel,
+    ChannelType.VoiceChannel.value: VoiceChannel
+}
+
+_CHANNEL_KWARGS: dict[str, tuple[tuple[str, str], ...]] = {
+    ChannelType.SavedMessages.value: (),
+    ChannelType.DirectMessage.value: (
+        ("last_message_id", "lastMessageID"),
+    ),
+    ChannelType.Group.value: (
+        ("description", "description"),
+        ("last_message_id", "lastMessageID"),
+        ("permissions", "permissions"),
+        ("nsfw", "nsfw")
+    ),
+    ChannelType.TextChannel.value: (
+        ("description", "description"),
+        ("default_permissions", "defaultPermissions"),
+        ("nsfw", "nsfw"),
+        ("last_message_id", "lastMessageID")
+    ),
+    ChannelType.VoiceChannel.value: (
+        ("description", "description"),
+        ("default_permissions", "defaultPermissions"),
+        ("nsfw", "nsfw")
+    )
+}
+
+_CHANNEL_ATTRIBUTES: dict[str, str] = {key: kwarg for kwargs in _CHANNEL_KWARGS.values() for key, kwarg in kwargs}
+
 class EmbedType(Enum):
     Website = "Website"
     Image = "Image"
@@ -346,7 +397,7 @@ class Message:
         if updatedData.get("mentions") is not None:
             mentions: list[User] = []
             for mention in updatedData["mentions"]:
-                mentions.append(await User.FromJSON(json.dumps(mention), self.session))
+                mentions.append(await User._FromDict(mention, self.session))
             self.mentions = mentions
         if updatedData.get("replies") is not None:
             replies: list[Message] = []
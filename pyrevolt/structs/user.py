@@ -1,7 +1,9 @@
 from __future__ import annotations
 from enum import Enum
-import json
+from types import MemberDescriptorType
+import asyncio
 from ..client import Method
+from ..serialization import loads
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..session import Session
@@ -21,7 +23,19 @@ class Presence(Enum):
     Invisible = "Invisible"
     Online = "Online"
 
+_STATUS_KWARGS: tuple[tuple[str, str], ...] = (
+    ("text", "text"),
+)
+
+_USER_KWARGS: tuple[tuple[str, str], ...] = (
+    ("badges", "badges"),
+    ("online", "online"),
+    ("flags", "flags")
+)
+
 class Status:
+    __slots__ = ("presence", "text")
+
     def __init__(self, presence: Presence, **kwargs) -> None:
         self.presence: Presence = presence
         self.text: str|None = kwargs.get("text")
@@ -31,13 +45,16 @@ class Status:
 
     @staticmethod
     async def FromJSON(jsonData: str|bytes) -> Status:
-        data: dict = json.loads(jsonData)
-        kwargs: dict = {}
-        if data.get("text") is not None:
-            kwargs["text"] = data["text"]
+        return Status._FromDict(loads(jsonData))
+
+    @staticmethod
+    def _FromDict(data: dict) -> Status:
+        kwargs: dict = {kwarg: value for key, kwarg in _STATUS_KWARGS if (value := data.get(key)) is not None}
         return Status(Presence(data["presence"]), **kwargs)
 
 class BotUser:
+    __slots__ = ("ownerID",)
+
     def __init__(self, ownerID: str) -> None:
         self.ownerID: str = ownerID
     
@@ -45,13 +62,15 @@ class BotUser:
         return f"<pyrevolt.Bot owner={self.ownerID}>"
 
 class User:
+    __slots__ = ("userID", "username", "badges", "online", "relationship", "status", "flags", "bot")
+
     def __init__(self, userID: str, username: str, **kwargs) -> None:
         self.userID: str = userID
         self.username: str = username
         self.badges: int|None = kwargs.get("badges")
         self.online: bool|None = kwargs.get("online")
         self.relationship: Relationship|None = kwargs.get("relationship")
-        self.status: dict|None = kwargs.get("status")
+        self.status: Status|None = kwargs.get("status")
         self.flags: int|None = kwargs.get("flags")
         self.bot: BotUser|None = kwargs.get("bot")
 
@@ -71,11 +90,13 @@ class User:
         if updateData.get("relationship") is not None:
             self.relationship = Relationship(updateData.get("relationship"))
         if updateData.get("status") is not None:
-            self.status = await Status.FromJSON(json.dumps(updateData.get("status")))
+            self.status = Status._FromDict(updateData["status"])
         self.flags = updateData.get("flags", self.flags)
         self.bot = updateData.get("bot", self.bot)
         for key in clear:
-            setattr(self, key, None)
+            key = key[:1].lower() + key[1:]
+            if isinstance(getattr(User, key, None), MemberDescriptorType):
+                setattr(self, key, None)
 
     @property
     def mention(self) -> str:
@@ -83,30 +104,38 @@ class User:
 
     @staticmethod
     async def FromJSON(jsonData: str|bytes, session: Session) -> User:
-        data: dict = json.loads(jsonData)
-        kwargs: dict = {}
-        if data.get("badges") is not None:
-            kwargs["badges"] = data["badges"]
-        if data.get("online") is not None:
-            kwargs["online"] = data["online"]
-        if data.get("relationship") is not None:
-            kwargs["relationship"] = Relationship(data["relationship"])
-        if data.get("status") is not None:
-            kwargs["status"] = await Status.FromJSON(json.dumps(data["status"]))
-        if data.get("bot") is not None:
-            kwargs["bot"] = BotUser(data["bot"]["owner"])
+        return await User._FromDict(loads(jsonData), session)
+
+    @staticmethod
+    async def _FromDict(data: dict, session: Session) -> User:
+        kwargs: dict = {kwarg: value for key, kwarg in _USER_KWARGS if (value := data.get(key)) is not None}
+        if (relationship := data.get("relationship")) is not None:
+            kwargs["relationship"] = Relationship(relationship)
+        if (status := data.get("status")) is not None:
+            kwargs["status"] = Status._FromDict(status)
+        if (bot := data.get("bot")) is not None:
+            kwargs["bot"] = BotUser(bot["owner"])
         user: User = User(data["_id"], data["username"], **kwargs)
         session.users[user.userID] = user
         return user
         
     @staticmethod
-    async def FromID(userID: str, session: Session) -> User:
+    async def FromID(userID: str, session: Session) -> User|None:
         if session.users.get(userID) is not None:
             return session.users[userID]
+        request: asyncio.Task | None = session.pendingUsers.get(userID)
+        if request is None:
+            request = asyncio.create_task(User._Fetch(userID, session))
+            session.pendingUsers[userID] = request
+            request.add_done_callback(lambda _: session.pendingUsers.pop(userID, None))
+        return await asyncio.shield(request)
+
+    @staticmethod
+    async def _Fetch(userID: str, session: Session) -> User|None:
         result: dict = await session.Request(Method.GET, f"/users/{userID}")
         if result.get("type") is not None:
             return
-        return await User.FromJSON(json.dumps(result), session)
+        return await User._FromDict(result, session)
 
     @staticmethod
     async def AttemptParse(content: str, session: Session) -> User | bool:
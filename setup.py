@@ -28,6 +28,9 @@ setup(
     long_description_content_type="text/markdown",
     include_package_data=True,
     install_requires=requirements,
+    extras_require={
+        "speed": ["orjson", "uvloop>=0.18; sys_platform != 'win32'"]
+    },
     python_requires=">=3.10",
     classifiers=[
         "Development Status :: 3 - Alpha",
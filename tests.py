@@ -1,7 +1,10 @@
 import asyncio
 import unittest
+import unittest.mock
 import os
 import pyrevolt
+from websockets.asyncio.client import ClientConnection
+from websockets.asyncio.server import serve
 
 class HTTPTests(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self) -> None:
@@ -27,6 +30,12 @@ class HTTPTests(unittest.IsolatedAsyncioTestCase):
         result: dict = await self.client.Request(request)
         self.assertEqual(result["username"], "Fabio")
 
+    async def test_context_manager(self) -> None:
+        async with pyrevolt.HTTPClient() as client:
+            result: dict = await client.Request(pyrevolt.Request(pyrevolt.Method.GET, "/"))
+        self.assertEqual(result["ws"], "wss://ws.revolt.chat")
+        self.assertTrue(client.client.closed)
+
 class GatewayTests(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self) -> None:
         self.gateway: pyrevolt.Gateway = pyrevolt.Gateway()
@@ -71,6 +80,15 @@ class GatewayTests(unittest.IsolatedAsyncioTestCase):
         result: dict = await asyncio.wait_for(self.gateway.Receive(), timeout=30)
         self.assertEqual(expectedPongResult, result)
 
+    async def test_gateway_url_cached(self) -> None:
+        self.gateway.GetWebsocketURL = unittest.mock.AsyncMock(wraps=self.gateway.GetWebsocketURL)
+        await self.gateway.Connect()
+        self.assertEqual(self.gateway.websocketURL, "wss://ws.revolt.chat")
+        await self.gateway.Close()
+        await self.gateway.Connect()
+        self.assertTrue(self.gateway.open)
+        self.gateway.GetWebsocketURL.assert_awaited_once()
+
     async def test_gateway_identify(self) -> None:
         expectedAuthenticatedResult: dict = {
             "type": pyrevolt.GatewayEvent.Authenticated.value.VALUE
@@ -79,6 +97,150 @@ class GatewayTests(unittest.IsolatedAsyncioTestCase):
         await self.gateway.Authenticate(os.getenv("token"))
         self.assertEqual(expectedAuthenticatedResult, await self.gateway.Receive())
 
+class LocalGatewayTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.connections: list[list[str]] = []
+        self.server = await serve(self.handler, "localhost", 0)
+        self.gateway: pyrevolt.Gateway = pyrevolt.Gateway()
+        self.gateway.websocketURL = f"ws://localhost:{self.server.sockets[0].getsockname()[1]}"
+        return await super().asyncSetUp()
+
+    async def asyncTearDown(self) -> None:
+        await self.gateway.Close()
+        self.server.close()
+        await self.server.wait_closed()
+        return await super().asyncTearDown()
+
+    async def handler(self, websocket) -> None:
+        frames: list[str] = []
+        self.connections.append(frames)
+        async for frame in websocket:
+            frames.append(frame)
+            if frame == "close":
+                await websocket.close()
+
+    async def test_reconnect_replaces_keep_alive(self) -> None:
+        self.gateway.keepAliveInterval = 0.2
+        await self.gateway.Connect()
+        oldKeepAlive: asyncio.Task = self.gateway.keepAlive
+        await self.gateway.SendRaw("close")
+        while self.gateway.open:
+            await asyncio.sleep(0.01)
+        await self.gateway.Connect()
+        await asyncio.sleep(0.5)
+        self.assertTrue(oldKeepAlive.cancelled())
+        self.assertEqual(len(self.connections), 2)
+        self.assertLessEqual(self.connections[1].count(self.gateway.pingFrame), 2)
+
+    async def test_receive_raises_reader_error(self) -> None:
+        with unittest.mock.patch.object(ClientConnection, "recv", side_effect=OSError("reset")):
+            await self.gateway.Connect()
+            with self.assertRaises(OSError):
+                await self.gateway.Receive()
+            with self.assertRaises(OSError):
+                await self.gateway.Receive()
+
+    async def test_receive_clean_close(self) -> None:
+        await self.gateway.Connect()
+        await self.gateway.SendRaw("close")
+        with self.assertRaises(pyrevolt.ClosedSocketException):
+            await self.gateway.Receive()
+
+class StubSession:
+    def __init__(self, responses: dict[str, dict | Exception]) -> None:
+        self.users: dict = {}
+        self.channels: dict = {}
+        self.pendingUsers: dict = {}
+        self.pendingChannels: dict = {}
+        self.responses: dict[str, dict | Exception] = responses
+        self.requests: list[str] = []
+
+    async def Request(self, method: pyrevolt.Method, url: str, **kwargs) -> dict:
+        self.requests.append(url)
+        await asyncio.sleep(0.05)
+        response: dict | Exception = self.responses[url]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+class FromIDTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.session: StubSession = StubSession({
+            "/users/U": {"_id": "U", "username": "user"},
+            "/users/E": OSError("reset"),
+            "/channels/C": {"_id": "C", "channel_type": "VoiceChannel", "server": "S", "name": "voice"},
+            "/channels/E": OSError("reset")
+        })
+        return await super().asyncSetUp()
+
+    async def test_user_single_request(self) -> None:
+        users: list[pyrevolt.User] = await asyncio.gather(*(pyrevolt.User.FromID("U", self.session) for _ in range(5)))
+        self.assertEqual(self.session.requests, ["/users/U"])
+        for user in users:
+            self.assertIs(user, users[0])
+        self.assertEqual(self.session.pendingUsers, {})
+
+    async def test_channel_single_request(self) -> None:
+        channels: list[pyrevolt.Channel] = await asyncio.gather(*(pyrevolt.Channel.FromID("C", self.session) for _ in range(5)))
+        self.assertEqual(self.session.requests, ["/channels/C"])
+        for channel in channels:
+            self.assertIs(channel, channels[0])
+        self.assertEqual(self.session.pendingChannels, {})
+
+    async def test_error_reaches_every_waiter(self) -> None:
+        users: list = await asyncio.gather(*(pyrevolt.User.FromID("E", self.session) for _ in range(3)), return_exceptions=True)
+        channels: list = await asyncio.gather(*(pyrevolt.Channel.FromID("E", self.session) for _ in range(3)), return_exceptions=True)
+        self.assertEqual(self.session.requests, ["/users/E", "/channels/E"])
+        for result in users + channels:
+            self.assertIsInstance(result, OSError)
+        self.assertEqual(self.session.pendingUsers, {})
+        self.assertEqual(self.session.pendingChannels, {})
+
+    async def test_cancelled_waiter_leaves_others(self) -> None:
+        waiters: list[asyncio.Task] = [asyncio.create_task(pyrevolt.User.FromID("U", self.session)) for _ in range(3)]
+        await asyncio.sleep(0)
+        waiters[0].cancel()
+        users: list = await asyncio.gather(*waiters, return_exceptions=True)
+        self.assertIsInstance(users[0], asyncio.CancelledError)
+        self.assertIsInstance(users[1], pyrevolt.User)
+        self.assertIs(users[1], users[2])
+        self.assertEqual(self.session.requests, ["/users/U"])
+        self.assertEqual(self.session.pendingUsers, {})
+
+class UpdateTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.session: StubSession = StubSession({})
+        return await super().asyncSetUp()
+
+    async def test_channel_update(self) -> None:
+        channel: pyrevolt.TextChannel = pyrevolt.TextChannel("C", "S", "text", description="old", session=self.session)
+        await channel.update({"last_message_id": "L", "name": "renamed", "unknownKey": 1}, ["Description", "Unknown"])
+        self.assertEqual(channel.lastMessageID, "L")
+        self.assertEqual(channel.name, "renamed")
+        self.assertIsNone(channel.description)
+        self.assertFalse(hasattr(channel, "unknownKey"))
+
+    async def test_group_update(self) -> None:
+        group: pyrevolt.Group = pyrevolt.Group("G", "group", [], None, description="old", session=self.session)
+        await group.update({"last_message_id": "L", "nsfw": True, "unknownKey": 1}, ["Description"])
+        self.assertEqual(group.lastMessageID, "L")
+        self.assertTrue(group.nsfw)
+        self.assertIsNone(group.description)
+
+    async def test_user_update(self) -> None:
+        user: pyrevolt.User = pyrevolt.User("U", "user", flags=1, status=pyrevolt.Status(pyrevolt.Presence.Online, text="hi"))
+        await user.update({"online": True, "unknownKey": 1}, ["Status", "Avatar"])
+        self.assertTrue(user.online)
+        self.assertIsNone(user.status)
+        self.assertEqual(user.flags, 1)
+        self.assertFalse(hasattr(user, "unknownKey"))
+
+    async def test_voice_channel_default_permissions(self) -> None:
+        channel: pyrevolt.Channel = await pyrevolt.Channel._FromDict({"_id": "V", "channel_type": "VoiceChannel", "server": "S", "name": "voice", "default_permissions": 8}, self.session)
+        self.assertIsInstance(channel, pyrevolt.VoiceChannel)
+        self.assertEqual(channel.defaultPermissions, 8)
+        self.assertIs(self.session.channels["V"], channel)
+
 class SessionTests(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self) -> None:
         self.session: pyrevolt.Session = pyrevolt.Session()